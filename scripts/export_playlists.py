@@ -9,13 +9,19 @@ in the specified output directory.
 import sys
 import os
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path to import from src
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.auth import get_spotify_client
-from src.playlist_fetcher import get_user_playlists, fetch_playlist_tracks
-from src.json_export import export_playlists, playlist_json_exists
+from src.playlist_fetcher import get_user_playlists, fetch_playlist_tracks, MAX_CONCURRENT_REQUESTS
+from src.json_export import export_playlists, playlist_json_exists, list_existing_json_files
+
+# Maximum number of playlists fetched from Spotify at the same time (their
+# page requests share the MAX_CONCURRENT_REQUESTS limit, so more wouldn't help)
+MAX_CONCURRENT_FETCHES = MAX_CONCURRENT_REQUESTS
 
 
 def main():
@@ -77,41 +83,69 @@ def main():
         playlists_with_tracks = []
         skipped_count = 0
         
+        # Read the output directory once instead of checking each playlist's file
+        existing_files = list_existing_json_files(args.output)
+        
+        # Start fetching every playlist that needs exporting; results are
+        # consumed below in playlist order so the progress output stays ordered
+        # (per-page progress is not printed, it would interleave across threads)
+        executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES)
+        cancelled = threading.Event()
+        interrupted = False
+        futures = {}
+        
         for i, playlist in enumerate(playlists_data, 1):
-            playlist_name = playlist.get('name', 'Unknown')
-            playlist_id = playlist.get('id')
-            
-            # Check if JSON file already exists
-            if playlist_json_exists(playlist_name, args.output):
+            if not playlist_json_exists(playlist.get('name', 'Unknown'), args.output, existing_files):
+                # Raise errors so they're reported below against this playlist
+                futures[i] = executor.submit(fetch_playlist_tracks, sp, playlist.get('id'),
+                                             raise_errors=True, stopped=cancelled)
+        
+        try:
+            for i, playlist in enumerate(playlists_data, 1):
+                playlist_name = playlist.get('name', 'Unknown')
+                playlist_id = playlist.get('id')
+                
+                # Check if JSON file already exists
+                if i not in futures:
+                    if args.verbose:
+                        print(f"[{i}/{len(playlists_data)}] Skipping {playlist_name} (file already exists)")
+                    else:
+                        print(f"[{i}/{len(playlists_data)}] {playlist_name}... ⊘ (skipped)")
+                    skipped_count += 1
+                    continue
+                
                 if args.verbose:
-                    print(f"[{i}/{len(playlists_data)}] Skipping {playlist_name} (file already exists)")
+                    print(f"[{i}/{len(playlists_data)}] Fetching tracks for: {playlist_name}")
                 else:
-                    print(f"[{i}/{len(playlists_data)}] {playlist_name}... ⊘ (skipped)")
-                skipped_count += 1
-                continue
-            
-            if args.verbose:
-                print(f"[{i}/{len(playlists_data)}] Fetching tracks for: {playlist_name}")
-            else:
-                print(f"[{i}/{len(playlists_data)}] {playlist_name}...", end=' ', flush=True)
-            
-            try:
-                tracks = fetch_playlist_tracks(sp, playlist_id, verbose=args.verbose)
+                    print(f"[{i}/{len(playlists_data)}] {playlist_name}...", end=' ', flush=True)
                 
-                playlists_with_tracks.append({
-                    'id': playlist_id,
-                    'name': playlist_name,
-                    'tracks': tracks
-                })
-                
-                if not args.verbose:
-                    print(f"✓ ({len(tracks)} tracks)")
+                try:
+                    tracks = futures[i].result()
                     
-            except Exception as e:
-                print(f"✗ Error: {e}")
-                if args.verbose:
-                    import traceback
-                    traceback.print_exc()
+                    playlists_with_tracks.append({
+                        'id': playlist_id,
+                        'name': playlist_name,
+                        'tracks': tracks
+                    })
+                    
+                    if args.verbose:
+                        print(f"Total tracks fetched: {len(tracks)}")
+                    else:
+                        print(f"✓ ({len(tracks)} tracks)")
+                        
+                except Exception as e:
+                    print(f"✗ Error: {e}")
+                    if args.verbose:
+                        import traceback
+                        traceback.print_exc()
+        except KeyboardInterrupt:
+            interrupted = True
+            raise
+        finally:
+            # Don't start queued fetches if we're bailing out early; on Ctrl-C,
+            # stop in-flight ones after their current request and don't wait
+            cancelled.set()
+            executor.shutdown(wait=not interrupted, cancel_futures=True)
         
         print()
         
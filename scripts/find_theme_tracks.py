@@ -13,6 +13,11 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Set
 
+try:
+    import orjson  # Optional: faster JSON parsing/serialization
+except ImportError:
+    orjson = None
+
 # Add src directory to path for imports
 src_path = Path(__file__).parent.parent / 'src'
 sys.path.insert(0, str(src_path))
@@ -24,6 +29,9 @@ from theme_matcher import (
     expand_keywords_with_synonyms
 )
 
+# Separators used to split a theme name into base keywords
+THEME_SEPARATOR_PATTERN = re.compile(r'[-_\s]+')
+
 
 def load_synonyms(synonym_file: str) -> Dict[str, List[str]]:
     """
@@ -148,8 +156,12 @@ def export_results_json(matching_tracks: List, output_file: str):
         }
         results.append(result)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    if orjson:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(results, indent=2, ensure_ascii=False))
     
     print(f"Results exported to: {output_file}")
 
@@ -217,7 +229,7 @@ Examples:
     synonyms = load_synonyms(synonym_file)
     
     # Extract base keywords from theme name (split by hyphens, underscores, spaces)
-    theme_keywords = re.split(r'[-_\s]+', args.theme)
+    theme_keywords = THEME_SEPARATOR_PATTERN.split(args.theme)
     theme_keywords = [kw.lower() for kw in theme_keywords if kw]
     
     # Also include the full theme name as a keyword
@@ -227,10 +239,11 @@ Examples:
     print(f"Keywords: {', '.join(theme_keywords)}")
     
     if synonyms:
-        # Expand keywords with synonyms
+        # Expand keywords with synonyms (once; the search below reuses the result)
         expanded = expand_keywords_with_synonyms(theme_keywords, synonyms)
         print(f"Expanded keywords (with synonyms): {', '.join(sorted(expanded))}")
     else:
+        expanded = frozenset(theme_keywords)
         print(f"Note: No synonym file found at '{synonym_file}' (using keywords only)")
     
     print(f"\nLoading tracks from: {args.data_dir}")
@@ -248,8 +261,7 @@ Examples:
     print(f"\nSearching for matches (min score: {args.min_score})...")
     matching_tracks = find_matching_tracks(
         tracks,
-        set(theme_keywords),
-        synonyms if synonyms else None,
+        expanded,
         min_score=args.min_score
     )
     
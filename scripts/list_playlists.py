@@ -42,7 +42,8 @@ def main():
         print("=" * 60)
         print()
         
-        # Display playlists
+        # Display playlists (collected and written at once)
+        blocks = []
         for i, playlist in enumerate(playlists, 1):
             name = playlist.get('name', 'Unknown')
             playlist_id = playlist.get('id', 'N/A')
@@ -50,12 +51,15 @@ def main():
             public = 'Public' if playlist.get('public', False) else 'Private'
             owner = playlist.get('owner', {}).get('display_name', 'Unknown')
             
-            print(f"{i}. {name}")
-            print(f"   ID: {playlist_id}")
-            print(f"   Tracks: {track_count}")
-            print(f"   Visibility: {public}")
-            print(f"   Owner: {owner}")
-            print()
+            blocks.append(
+                f"{i}. {name}\n"
+                f"   ID: {playlist_id}\n"
+                f"   Tracks: {track_count}\n"
+                f"   Visibility: {public}\n"
+                f"   Owner: {owner}\n"
+                "\n"
+            )
+        sys.stdout.write(''.join(blocks))
         
         print("=" * 60)
         print("To fetch a playlist, use:")
@@ -10,8 +10,23 @@ import sys
 import os
 import json
 import argparse
-from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
+try:
+    import orjson  # Optional: faster JSON parsing/serialization
+except ImportError:
+    orjson = None
+
+# Number of playlist files read concurrently
+MAX_LOAD_WORKERS = 8
+
+# Track fields that can be used with --sort
+SORT_FIELDS = ('name', 'artist', 'album')
+
+# Fallback values for missing track fields (matches the exporter's defaults)
+FIELD_DEFAULTS = {'name': 'Unknown Track', 'artist': 'Unknown Artist', 'album': 'Unknown Album'}
 
 
 def extract_playlist_name_from_filename(filename: str) -> str:
@@ -31,11 +46,46 @@ def extract_playlist_name_from_filename(filename: str) -> str:
     return name
 
 
+def load_tracks_from_json_file(json_path: str) -> list:
+    """
+    Load the tracks from a single playlist JSON file.
+    
+    Errors are reported to stderr and yield an empty list, so one bad file
+    does not stop the others from loading.
+    
+    Args:
+        json_path: Path to a JSON playlist file
+    
+    Returns:
+        list: Track dictionaries tagged with a 'playlist' field
+    """
+    tracks = []
+    filename = os.path.basename(json_path)
+    
+    try:
+        playlist_name = extract_playlist_name_from_filename(filename)
+        with open(json_path, 'rb') as f:
+            data = f.read()
+        playlist_tracks = orjson.loads(data) if orjson else json.loads(data)
+        if isinstance(playlist_tracks, list):
+            # Add playlist name to each track (freshly parsed, safe to modify)
+            for track in playlist_tracks:
+                track['playlist'] = playlist_name
+                tracks.append(track)
+    except json.JSONDecodeError as e:
+        print(f"Warning: Error reading {filename}: {e}", file=sys.stderr)
+    except Exception as e:
+        print(f"Warning: Error processing {filename}: {e}", file=sys.stderr)
+    
+    return tracks
+
+
 def load_tracks_from_json_files(data_dir: str) -> list:
     """
     Load all tracks from JSON files in the data directory.
     
     Tracks which playlist each track comes from by adding a 'playlist' field.
+    Files are read concurrently; tracks keep the order of the file listing.
     
     Args:
         data_dir: Directory containing JSON playlist files
@@ -44,33 +94,27 @@ def load_tracks_from_json_files(data_dir: str) -> list:
         list: List of track dictionaries with 'name', 'artist', 'album', 'release_year', 'playlist'
     """
     tracks = []
-    data_path = Path(data_dir)
     
-    if not data_path.exists():
+    if not os.path.exists(data_dir):
         print(f"Error: Directory '{data_dir}' does not exist.")
         return tracks
     
-    json_files = list(data_path.glob('*.json'))
+    # scandir reuses the directory entry's type info instead of building a
+    # Path and matching a glob pattern per file (a plain file has no entries)
+    json_files = []
+    if os.path.isdir(data_dir):
+        with os.scandir(data_dir) as entries:
+            json_files = [entry.path for entry in entries
+                          if entry.name.endswith('.json') and entry.is_file()]
     
     if not json_files:
         print(f"No JSON files found in '{data_dir}'")
         return tracks
     
-    for json_file in json_files:
-        try:
-            playlist_name = extract_playlist_name_from_filename(json_file.name)
-            with open(json_file, 'r', encoding='utf-8') as f:
-                playlist_tracks = json.load(f)
-                if isinstance(playlist_tracks, list):
-                    # Add playlist name to each track
-                    for track in playlist_tracks:
-                        track_copy = track.copy()
-                        track_copy['playlist'] = playlist_name
-                        tracks.append(track_copy)
-        except json.JSONDecodeError as e:
-            print(f"Warning: Error reading {json_file.name}: {e}", file=sys.stderr)
-        except Exception as e:
-            print(f"Warning: Error processing {json_file.name}: {e}", file=sys.stderr)
+    # Overlap file reads across a small thread pool
+    with ThreadPoolExecutor(max_workers=MAX_LOAD_WORKERS) as executor:
+        for playlist_tracks in executor.map(load_tracks_from_json_file, json_files):
+            tracks.extend(playlist_tracks)
     
     return tracks
 
@@ -101,38 +145,37 @@ def deduplicate_tracks(tracks: list) -> list:
         tracks: List of track dictionaries with 'playlist' field
     
     Returns:
-        list: List of unique tracks with merged playlist names
+        list: List of unique tracks with merged playlist names and
+              lowercase '_<field>_lc' sort keys for each of SORT_FIELDS
     """
-    track_dict = {}  # key: (name, artist) -> track with merged playlists
+    track_dict = {}  # key: (name, artist) -> (first occurrence, lowercase name, lowercase artist)
+    playlist_sets = defaultdict(set)  # key: (name, artist) -> playlist names
     
     for track in tracks:
-        name = track.get('name', 'Unknown Track').lower().strip()
-        artist = track.get('artist', 'Unknown Artist').lower().strip()
-        track_key = (name, artist)
-        playlist = track.get('playlist', 'Unknown')
+        # 'or' also covers fields stored as null
+        name_lc = (track.get('name') or FIELD_DEFAULTS['name']).lower()
+        artist_lc = (track.get('artist') or FIELD_DEFAULTS['artist']).lower()
+        track_key = (name_lc.strip(), artist_lc.strip())
         
-        if track_key in track_dict:
-            # Track already seen, merge playlist names
-            existing_track = track_dict[track_key]
-            existing_playlists = existing_track.get('playlists', [existing_track.get('playlist', 'Unknown')])
-            
-            # Add new playlist if not already in list
-            if playlist not in existing_playlists:
-                existing_playlists.append(playlist)
-            
-            # Update the playlists field (sorted for consistency)
-            existing_playlists.sort()
-            existing_track['playlists'] = existing_playlists
-        else:
-            # First occurrence of this track
-            track_copy = track.copy()
-            track_copy['playlists'] = [playlist]
-            # Remove the single 'playlist' field, use 'playlists' instead
-            if 'playlist' in track_copy:
-                del track_copy['playlist']
-            track_dict[track_key] = track_copy
-    
-    return list(track_dict.values())
+        # Keep a reference to the first occurrence; it is only copied once below
+        if track_key not in track_dict:
+            track_dict[track_key] = (track, name_lc, artist_lc)
+        playlist_sets[track_key].add(track.get('playlist', 'Unknown'))
+    
+    unique_tracks = []
+    for track_key, (track, name_lc, artist_lc) in track_dict.items():
+        # Replace the single 'playlist' field with the merged 'playlists' list
+        # (sorted for consistency)
+        merged = {field: value for field, value in track.items() if field != 'playlist'}
+        merged['playlists'] = sorted(playlist_sets[track_key])
+        
+        # Lowercase sort keys, reusing the ones computed for the key above
+        merged['_name_lc'] = name_lc
+        merged['_artist_lc'] = artist_lc
+        merged['_album_lc'] = (track.get('album') or FIELD_DEFAULTS['album']).lower()
+        unique_tracks.append(merged)
+    
+    return unique_tracks
 
 
 def format_track(track: dict) -> str:
@@ -181,7 +224,7 @@ def main():
     )
     parser.add_argument(
         '--sort',
-        choices=['name', 'artist', 'album'],
+        choices=SORT_FIELDS,
         default='name',
         help='Sort tracks by field (default: name)'
     )
@@ -211,13 +254,8 @@ def main():
     year_tracks = deduplicate_tracks(year_tracks)
     duplicates_removed = original_count - len(year_tracks)
     
-    # Sort tracks
-    if args.sort == 'name':
-        year_tracks.sort(key=lambda t: t.get('name', '').lower())
-    elif args.sort == 'artist':
-        year_tracks.sort(key=lambda t: t.get('artist', '').lower())
-    elif args.sort == 'album':
-        year_tracks.sort(key=lambda t: t.get('album', '').lower())
+    # Sort tracks using the lowercase keys precomputed during deduplication
+    year_tracks.sort(key=itemgetter(f'_{args.sort}_lc'))
     
     # Output tracks
     if args.group_by_playlist:
@@ -226,9 +264,8 @@ def main():
         print(f"Tracks from {args.year} (grouped by playlist not yet implemented):")
         print()
     
-    # Print tracks one per line
-    for track in year_tracks:
-        print(format_track(track))
+    # Print tracks one per line, as a single write
+    sys.stdout.write('\n'.join(map(format_track, year_tracks)) + '\n')
     
     # Print summary
     summary = f"Total: {len(year_tracks)} unique track(s) from {args.year}"
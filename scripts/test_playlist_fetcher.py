@@ -15,6 +15,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from src.auth import get_spotify_client
 from src.playlist_fetcher import fetch_single_playlist
 
+# Translation table that drops the '-' and '_' allowed in playlist IDs
+ID_SEPARATOR_TABLE = str.maketrans('', '', '-_')
+
 
 def main():
     """Test playlist fetcher."""
@@ -30,7 +33,7 @@ def main():
     if len(sys.argv) > 1:
         arg = sys.argv[1]
         # Check if it looks like a Spotify ID (alphanumeric, 22 chars)
-        if len(arg) == 22 and arg.replace('-', '').replace('_', '').isalnum():
+        if len(arg) == 22 and arg.translate(ID_SEPARATOR_TABLE).isalnum():
             playlist_id = arg
         else:
             playlist_name = arg
@@ -81,7 +84,7 @@ def main():
         # Optionally save to JSON for inspection
         output_file = f"test_playlist_{playlist['id']}.json"
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(playlist, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(playlist, indent=2, ensure_ascii=False))
         print(f"\nPlaylist data saved to: {output_file}")
         
         return 0
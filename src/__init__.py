@@ -6,6 +6,7 @@ from .auth import get_spotify_client, load_spotify_credentials
 from .playlist_fetcher import (
     fetch_single_playlist,
     fetch_playlist_tracks,
+    iter_playlist_tracks,
     get_user_playlists,
     extract_track_details,
     extract_release_year
@@ -15,7 +16,11 @@ from .json_export import (
     export_playlists,
     sanitize_playlist_name,
     playlist_json_exists,
-    get_playlist_json_path
+    list_existing_json_files,
+    json_file_taken,
+    get_playlist_json_path,
+    get_available_json_path,
+    write_playlist_json
 )
 
 __all__ = [
@@ -23,6 +28,7 @@ __all__ = [
     'load_spotify_credentials',
     'fetch_single_playlist',
     'fetch_playlist_tracks',
+    'iter_playlist_tracks',
     'get_user_playlists',
     'extract_track_details',
     'extract_release_year',
@@ -30,6 +36,10 @@ __all__ = [
     'export_playlists',
     'sanitize_playlist_name',
     'playlist_json_exists',
-    'get_playlist_json_path'
+    'list_existing_json_files',
+    'json_file_taken',
+    'get_playlist_json_path',
+    'get_available_json_path',
+    'write_playlist_json'
 ]
 
@@ -6,9 +6,19 @@ Automatically handles token refresh and credential management.
 """
 
 import os
+from functools import lru_cache
+import requests
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
 from dotenv import load_dotenv
+from urllib3.util.retry import Retry
+
+from .playlist_fetcher import MAX_CONCURRENT_REQUESTS
+
+# Connection pool size for the shared HTTP session: one connection per
+# request allowed in flight at once, so concurrent fetches reuse
+# connections instead of discarding them
+HTTP_POOL_SIZE = MAX_CONCURRENT_REQUESTS
 
 
 def load_spotify_credentials():
@@ -37,7 +47,41 @@ def load_spotify_credentials():
     return client_id, client_secret, redirect_uri
 
 
-def get_spotify_client(scope='playlist-read-private'):
+def create_http_session():
+    """
+    Create a pooled HTTP session for the Spotify client.
+    
+    Uses the same retry policy Spotipy applies to its own sessions
+    (retries on 429 and 5xx responses, honouring Retry-After), with a
+    larger connection pool so keep-alive connections are reused across
+    paginated and concurrent requests.
+    
+    Returns:
+        requests.Session: Session with retrying, pooled HTTP adapters mounted
+    """
+    retry = Retry(
+        total=spotipy.Spotify.max_retries,
+        connect=None,
+        read=False,
+        allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+        status=spotipy.Spotify.max_retries,
+        backoff_factor=0.3,
+        status_forcelist=spotipy.Spotify.default_retry_codes
+    )
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=retry
+    )
+    
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def get_spotify_client(scope='playlist-read-private', verify=False):
     """
     Authenticate with Spotify and return an authenticated Spotipy client.
     
@@ -46,9 +90,17 @@ def get_spotify_client(scope='playlist-read-private'):
     - Token caching (stores tokens in .cache file)
     - Token refresh (automatically refreshes expired tokens)
     
+    The client is cached, so repeated calls in the same process reuse it
+    and its HTTP connection pool.
+    
+    The token is not checked against the API by default: Spotipy validates
+    and refreshes the cached token itself on the first real request.
+    
     Args:
         scope (str): Spotify API scope. Default is 'playlist-read-private'
                     which allows reading user's private playlists.
+        verify (bool): If True, make an extra current_user() request to
+                    confirm the token works and print who is signed in.
     
     Returns:
         spotipy.Spotify: Authenticated Spotify client
@@ -73,14 +125,15 @@ def get_spotify_client(scope='playlist-read-private'):
     )
     
     # Create and return authenticated Spotify client
-    sp = spotipy.Spotify(auth_manager=auth_manager)
-    
-    # Verify authentication by getting current user
-    try:
-        user = sp.current_user()
-        print(f"Authenticated as: {user['display_name']} ({user['id']})")
-    except Exception as e:
-        raise spotipy.exceptions.SpotifyException(f"Authentication verification failed: {e}")
+    sp = spotipy.Spotify(auth_manager=auth_manager, requests_session=create_http_session())
+    
+    # Optionally verify authentication by getting current user
+    if verify:
+        try:
+            user = sp.current_user()
+            print(f"Authenticated as: {user['display_name']} ({user['id']})")
+        except Exception as e:
+            raise spotipy.exceptions.SpotifyException(f"Authentication verification failed: {e}")
     
     return sp
 
@@ -6,16 +6,30 @@ Exports playlists to JSON files with sanitized filenames.
 
 import os
 import json
-import re
-from typing import List, Dict, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Optional, Set, Union
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster JSON parsing/serialization
+except ImportError:
+    orjson = None
 
+# Translation table that deletes characters not allowed in filenames
+INVALID_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
+# Characters of encoded JSON gathered before each write (stdlib encoder only)
+JSON_WRITE_CHUNK_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=1024)
 def sanitize_playlist_name(name: str) -> str:
     """
     Sanitize playlist name for use as a filename.
     
-    Removes or replaces invalid filename characters.
+    Removes or replaces invalid filename characters. Results are cached,
+    since the same name is sanitized for the skip check and again for the write.
     
     Args:
         name: Playlist name
@@ -23,15 +37,13 @@ def sanitize_playlist_name(name: str) -> str:
     Returns:
         str: Sanitized filename-safe string
     """
-    # Remove or replace invalid characters
+    # Remove invalid characters
     # Keep alphanumeric, spaces, hyphens, underscores
-    sanitized = re.sub(r'[<>:"/\\|?*]', '', name)
+    sanitized = name.translate(INVALID_FILENAME_CHARS)
     
-    # Replace multiple spaces/hyphens with single
-    sanitized = re.sub(r'[\s-]+', '-', sanitized)
-    
-    # Remove leading/trailing hyphens and spaces
-    sanitized = sanitized.strip('- ')
+    # Replace runs of whitespace/hyphens with a single hyphen; splitting
+    # also drops leading/trailing hyphens and spaces
+    sanitized = '-'.join(sanitized.replace('-', ' ').split())
     
     # Limit length (max 200 chars for filename)
     if len(sanitized) > 200:
@@ -60,24 +72,170 @@ def get_playlist_json_path(playlist_name: str, output_dir: str = 'data') -> str:
     return os.path.join(output_dir, filename)
 
 
-def playlist_json_exists(playlist_name: str, output_dir: str = 'data') -> bool:
+def list_existing_json_files(output_dir: str = 'data') -> Set[str]:
+    """
+    List the JSON filenames already present in the output directory.
+    
+    Reading the directory once lets callers check many playlists
+    without a stat call per playlist. Add names to the set as files are
+    written to keep it current.
+    
+    Check paths against the set with json_file_taken(), which also catches
+    names that only differ in case on case-insensitive filesystems.
+    
+    Args:
+        output_dir: Directory where JSON files are saved
+    
+    Returns:
+        set: Filenames (not paths) ending in .json, empty if the directory is missing
+    """
+    if not os.path.isdir(output_dir):
+        return set()
+    
+    with os.scandir(output_dir) as entries:
+        return {entry.name for entry in entries if entry.name.casefold().endswith('.json')}
+
+
+def json_file_taken(filepath: str, existing_files: Set[str],
+                    count_pending: bool = True) -> bool:
+    """
+    Check whether a JSON file path is taken, given a set from list_existing_json_files().
+    
+    An exact filename match is taken. A name that only differs in case from a
+    listed one is the same file on case-insensitive filesystems (macOS,
+    Windows) but a different one elsewhere, so the filesystem decides that
+    case, as a per-file os.path.exists check would. A differently-cased
+    listed name that is not on disk yet (a pending write) can't be checked
+    that way; it counts as taken only if count_pending is True.
+    
+    Args:
+        filepath: Path of the JSON file to check
+        existing_files: Filenames from list_existing_json_files(), plus any added since
+        count_pending: Treat case-only matches with pending writes as taken.
+                       Pass False for "already exported" checks, so such a
+                       playlist is given a suffixed name instead of skipped.
+    
+    Returns:
+        bool: True if the path is taken
+    """
+    filename = os.path.basename(filepath)
+    if filename in existing_files:
+        return True
+    
+    folded = filename.casefold()
+    case_matches = [name for name in existing_files if name.casefold() == folded]
+    if not case_matches:
+        return False
+    
+    if os.path.exists(filepath):
+        return True
+    
+    if not count_pending:
+        return False
+    
+    output_dir = os.path.dirname(filepath)
+    return any(not os.path.exists(os.path.join(output_dir, name)) for name in case_matches)
+
+
+def playlist_json_exists(playlist_name: str, output_dir: str = 'data',
+                         existing_files: Optional[Set[str]] = None) -> bool:
     """
     Check if a JSON file already exists for a playlist.
     
     Args:
         playlist_name: Name of the playlist
         output_dir: Directory where JSON files are saved
+        existing_files: Optional set from list_existing_json_files(); when given,
+                        it is checked with json_file_taken() instead of
+                        a stat per playlist
     
     Returns:
         bool: True if JSON file exists, False otherwise
     """
     filepath = get_playlist_json_path(playlist_name, output_dir)
+    if existing_files is not None:
+        return json_file_taken(filepath, existing_files, count_pending=False)
     return os.path.exists(filepath)
 
 
+def get_available_json_path(playlist_name: str, output_dir: str = 'data',
+                            existing_files: Optional[Set[str]] = None) -> str:
+    """
+    Get a JSON file path for a playlist that doesn't collide with existing files.
+    
+    Appends _1, _2, ... to the sanitized name until the path is free.
+    
+    Args:
+        playlist_name: Name of the playlist
+        output_dir: Directory where JSON files are saved
+        existing_files: Optional set from list_existing_json_files(), plus names
+                        claimed by pending writes; when given, it is checked
+                        with json_file_taken() instead of a stat per candidate
+    
+    Returns:
+        str: Filepath that is not yet taken
+    """
+    # Sanitize playlist name for filename
+    sanitized_name = sanitize_playlist_name(playlist_name)
+    filename = f"{sanitized_name}.json"
+    filepath = os.path.join(output_dir, filename)
+    
+    def is_taken(filepath: str) -> bool:
+        if existing_files is not None:
+            return json_file_taken(filepath, existing_files)
+        return os.path.exists(filepath)
+    
+    # Handle filename collisions by appending number
+    counter = 1
+    while is_taken(filepath):
+        filename = f"{sanitized_name}_{counter}.json"
+        filepath = os.path.join(output_dir, filename)
+        counter += 1
+    
+    return filepath
+
+
+def write_playlist_json(tracks: List[Dict], filepath: str) -> str:
+    """
+    Write a playlist's tracks to a JSON file.
+    
+    Kept as a plain top-level function so it can run in a worker process.
+    Without orjson the document is encoded and written in chunks, so the
+    whole JSON text is never held in memory at once.
+    
+    Args:
+        tracks: List of track dicts (minimal format)
+        filepath: Destination file path
+    
+    Returns:
+        str: Path to the written JSON file
+    """
+    if orjson:
+        # Same output as the json.dumps call below (UTF-8, 2-space indent)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(tracks, option=orjson.OPT_INDENT_2))
+    else:
+        # Same output as json.dumps(tracks, indent=2, ensure_ascii=False)
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            chunk = []
+            chunk_size = 0
+            for part in encoder.iterencode(tracks):
+                chunk.append(part)
+                chunk_size += len(part)
+                if chunk_size >= JSON_WRITE_CHUNK_SIZE:
+                    f.write(''.join(chunk))
+                    chunk = []
+                    chunk_size = 0
+            f.write(''.join(chunk))
+    
+    return filepath
+
+
 def export_playlist_to_json(playlist: Dict, output_dir: str = 'data', 
                             skip_existing: bool = True,
-                            verbose: bool = False) -> Optional[str]:
+                            verbose: bool = False,
+                            existing_files: Optional[Set[str]] = None) -> Optional[str]:
     """
     Export a single playlist to a JSON file.
     
@@ -86,43 +244,44 @@ def export_playlist_to_json(playlist: Dict, output_dir: str = 'data',
         output_dir: Directory to save JSON files (default: 'data')
         skip_existing: If True, skip if file already exists (default: True)
         verbose: If True, print progress information
+        existing_files: Optional set from list_existing_json_files(); when given,
+                        it is checked with json_file_taken() instead of a
+                        stat per check, and the written filename is added to it
     
     Returns:
         str: Path to the created JSON file, or None if skipped
     """
     playlist_name = playlist.get('name', 'Unknown')
     
+    # Build the path once; it serves both the skip check and the write
+    filepath = get_playlist_json_path(playlist_name, output_dir)
+    
     # Check if file already exists
-    if skip_existing:
-        filepath = get_playlist_json_path(playlist_name, output_dir)
-        if os.path.exists(filepath):
-            if verbose:
-                print(f"  ⊘ Skipped (file already exists): {filepath}")
-            return None
+    if existing_files is not None:
+        exists = json_file_taken(filepath, existing_files, count_pending=False)
+    else:
+        exists = os.path.exists(filepath)
     
-    # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    if exists and skip_existing:
+        if verbose:
+            print(f"  ⊘ Skipped (file already exists): {filepath}")
+        return None
     
-    # Sanitize playlist name for filename
-    sanitized_name = sanitize_playlist_name(playlist_name)
-    filename = f"{sanitized_name}.json"
-    filepath = os.path.join(output_dir, filename)
+    # Taken (or claimed by a pending write): find a free name with a numeric suffix
+    if exists or (existing_files is not None and json_file_taken(filepath, existing_files)):
+        filepath = get_available_json_path(playlist_name, output_dir,
+                                           existing_files=existing_files)
     
-    # Handle filename collisions by appending number
-    counter = 1
-    original_filepath = filepath
-    while os.path.exists(filepath):
-        base_name = sanitized_name
-        filename = f"{base_name}_{counter}.json"
-        filepath = os.path.join(output_dir, filename)
-        counter += 1
+    # Create output directory if it doesn't exist
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
     
     # Extract just the tracks array (minimal format)
     tracks = playlist.get('tracks', [])
     
     # Write JSON file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(tracks, f, indent=2, ensure_ascii=False)
+    write_playlist_json(tracks, filepath)
+    if existing_files is not None:
+        existing_files.add(os.path.basename(filepath))
     
     if verbose:
         print(f"  ✓ Exported {len(tracks)} tracks to: {filepath}")
@@ -137,6 +296,11 @@ def export_playlists(playlists: List[Dict], output_dir: str = 'data',
     """
     Export multiple playlists to JSON files.
     
+    Filenames are chosen in this process. Without orjson, the JSON encoding
+    and writing is spread across worker processes; orjson encodes faster
+    than tracks can be sent to a worker, so then files are written here.
+    Progress is reported in playlist order.
+    
     Args:
         playlists: List of playlist dicts with 'name', 'id', and 'tracks'
         output_dir: Directory to save JSON files (default: 'data')
@@ -160,28 +324,90 @@ def export_playlists(playlists: List[Dict], output_dir: str = 'data',
         print(f"Output directory: {output_dir}")
         print()
     
-    exported_files = []
+    # Pick every destination path up front so that writes running in
+    # parallel can't race each other for the same filename. The output
+    # directory is read once; planned files are added to the same set.
+    exports = []
+    planned_count = 0
+    existing_files = list_existing_json_files(output_dir)
     
-    for i, playlist in enumerate(playlists, 1):
-        playlist_name = playlist.get('name', 'Unknown')
-        track_count = len(playlist.get('tracks', []))
-        
-        if verbose:
-            print(f"[{i}/{len(playlists)}] Exporting: {playlist_name} ({track_count} tracks)")
+    for playlist in playlists:
+        export = {
+            'name': playlist.get('name', 'Unknown'),
+            'tracks': playlist.get('tracks', []),
+            'filepath': None,
+            'skipped_path': None,
+            'future': None,
+            'error': None
+        }
+        exports.append(export)
         
         try:
-            filepath = export_playlist_to_json(playlist, output_dir, skip_existing, verbose)
-            if filepath:  # Only add if not skipped
-                exported_files.append(filepath)
+            # Check if file already exists (or is about to be written)
+            if skip_existing and playlist_json_exists(export['name'], output_dir, existing_files):
+                export['skipped_path'] = get_playlist_json_path(export['name'], output_dir)
+                continue
+            
+            export['filepath'] = get_available_json_path(export['name'], output_dir,
+                                                         existing_files=existing_files)
+            existing_files.add(os.path.basename(export['filepath']))
+            planned_count += 1
         except Exception as e:
-            print(f"  ✗ Error exporting {playlist_name}: {e}")
+            export['error'] = e
+    
+    exported_files = []
+    
+    if planned_count:
+        # Create output directory if it doesn't exist
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+    
+    # Worker processes only pay off for the (slow) stdlib encoder with
+    # several writes and several cores
+    use_processes = (orjson is None and planned_count > 1
+                     and (os.cpu_count() or 1) > 1)
+    executor = ProcessPoolExecutor() if use_processes else None
+    
+    try:
+        if executor:
+            for export in exports:
+                if export['filepath']:
+                    export['future'] = executor.submit(write_playlist_json, export['tracks'], export['filepath'])
+        
+        for i, export in enumerate(exports, 1):
+            playlist_name = export['name']
+            track_count = len(export['tracks'])
+            
             if verbose:
-                import traceback
-                traceback.print_exc()
+                print(f"[{i}/{len(playlists)}] Exporting: {playlist_name} ({track_count} tracks)")
+            
+            if export['skipped_path']:
+                if verbose:
+                    print(f"  ⊘ Skipped (file already exists): {export['skipped_path']}")
+                continue
+            
+            try:
+                if export['error']:
+                    raise export['error']
+                
+                if export['future']:
+                    filepath = export['future'].result()
+                else:
+                    filepath = write_playlist_json(export['tracks'], export['filepath'])
+                exported_files.append(filepath)
+                
+                if verbose:
+                    print(f"  ✓ Exported {track_count} tracks to: {filepath}")
+            except Exception as e:
+                print(f"  ✗ Error exporting {playlist_name}: {e}")
+                if verbose:
+                    import traceback
+                    traceback.print_exc()
+    finally:
+        if executor:
+            executor.shutdown(wait=True, cancel_futures=True)
     
     if verbose:
         print()
         print(f"✓ Exported {len(exported_files)} playlist(s) to {output_dir}/")
     
     return exported_files
-
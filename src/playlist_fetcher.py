@@ -5,8 +5,33 @@ Fetches playlists and tracks from Spotify, extracting minimal track details.
 Handles pagination and edge cases.
 """
 
-import re
-from typing import List, Dict, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterator, List, Dict, Optional
+
+# Spotify API max tracks per request
+PAGE_SIZE = 100
+
+# Only the parts of a tracks page that are actually used (track details
+# read by extract_track_details, plus paging info)
+TRACK_PAGE_FIELDS = 'items(track(name,artists(name),album(name,release_date))),next,total'
+
+# Number of track pages of a single playlist fetched at the same time
+PAGE_FETCH_WORKERS = 4
+
+# Most track page requests in flight at once across all threads, to stay
+# within Spotify's rate limit (also sizes the HTTP connection pool and the
+# number of playlists export_playlists.py fetches in parallel)
+MAX_CONCURRENT_REQUESTS = 5
+
+# Shared by every thread calling fetch_tracks_page, so page workers nested
+# inside concurrent playlist fetches can't exceed MAX_CONCURRENT_REQUESTS
+REQUEST_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# Extra attempts for a page that keeps hitting the rate limit (HTTP 429)
+MAX_RATE_LIMIT_RETRIES = 3
 
 
 def extract_release_year(release_date: Optional[str]) -> Optional[int]:
@@ -28,12 +53,9 @@ def extract_release_year(release_date: Optional[str]) -> Optional[int]:
         return None
     
     # Extract year (first 4 digits)
-    match = re.match(r'^(\d{4})', release_date)
-    if match:
-        try:
-            return int(match.group(1))
-        except ValueError:
-            return None
+    year = release_date[:4]
+    if len(year) == 4 and year.isdecimal():
+        return int(year)
     
     return None
 
@@ -93,30 +115,121 @@ def extract_track_details(track_item: Dict) -> Optional[Dict]:
     }
 
 
-def fetch_playlist_tracks(sp, playlist_id: str, verbose: bool = False) -> List[Dict]:
+def fetch_tracks_page(sp, playlist_id: str, offset: int, limit: int = PAGE_SIZE,
+                      stopped: Optional[threading.Event] = None) -> Optional[Dict]:
     """
-    Fetch all tracks from a playlist, handling pagination.
+    Fetch one page of a playlist's tracks, waiting out rate limits.
+    
+    Only the fields in TRACK_PAGE_FIELDS are requested, which keeps pages
+    much smaller than full track objects.
+    
+    At most MAX_CONCURRENT_REQUESTS pages are requested at once across all
+    threads. The HTTP session already retries 429 responses; this covers
+    the case where those retries are exhausted while many pages are in flight.
     
     Args:
         sp: Authenticated Spotipy client
         playlist_id: Spotify playlist ID
-        verbose: If True, print progress information
+        offset: Index of the first track to return
+        limit: Number of tracks to return
+        stopped: Optional event; if it is set by the time a request slot is
+                 free, the fetch is being abandoned and the page isn't requested
     
     Returns:
-        list: List of track detail dictionaries
+        dict: Spotify playlist tracks response (filtered to TRACK_PAGE_FIELDS),
+              or None if stopped
     """
-    tracks = []
-    offset = 0
-    limit = 100  # Spotify API max per request
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        try:
+            with REQUEST_SLOTS:
+                if stopped is not None and stopped.is_set():
+                    return None
+                return sp.playlist_tracks(playlist_id, fields=TRACK_PAGE_FIELDS,
+                                          limit=limit, offset=offset)
+        except Exception as e:
+            if getattr(e, 'http_status', None) != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                raise
+            
+            headers = getattr(e, 'headers', None) or {}
+            try:
+                retry_after = int(headers.get('Retry-After', 1))
+            except (TypeError, ValueError):
+                retry_after = 1
+            time.sleep(retry_after)
+
+
+def iter_track_pages(sp, playlist_id: str, limit: int = PAGE_SIZE,
+                     stopped: Optional[threading.Event] = None) -> Iterator[Optional[Dict]]:
+    """
+    Yield the pages of a playlist's tracks in order.
+    
+    The first page reports the playlist's total, so the remaining pages are
+    requested concurrently and yielded in offset order. If the playlist grew
+    in the meantime, further pages are followed sequentially via 'next'.
+    
+    Args:
+        sp: Authenticated Spotipy client
+        playlist_id: Spotify playlist ID
+        limit: Number of tracks per page
+        stopped: Optional event that makes pages not yet requested come back as None
+    
+    Yields:
+        dict: Spotify playlist tracks responses (None once stopped)
+    """
+    results = fetch_tracks_page(sp, playlist_id, 0, limit, stopped)
+    yield results
+    
+    if not results or not results.get('next'):
+        return
+    
+    offsets = range(limit, results.get('total') or 0, limit)
+    fetch_page = partial(fetch_tracks_page, sp, playlist_id, limit=limit, stopped=stopped)
+    
+    executor = ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS)
+    try:
+        for results in executor.map(fetch_page, offsets):
+            yield results
+    finally:
+        # If the consumer stops early, don't fetch the pages still queued
+        executor.shutdown(wait=True, cancel_futures=True)
+    
+    # Follow any pages added after the total was read
+    offset = offsets[-1] if offsets else 0
+    while results and results.get('next'):
+        offset += limit
+        results = fetch_page(offset)
+        yield results
+
+
+def iter_playlist_tracks(sp, playlist_id: str, verbose: bool = False,
+                         raise_errors: bool = False,
+                         stopped: Optional[threading.Event] = None) -> Iterator[Dict]:
+    """
+    Yield all tracks from a playlist as their pages arrive, handling pagination.
+    
+    By default, errors while fetching are printed and end the iteration, so
+    the tracks yielded up to that point are kept.
+    
+    Args:
+        sp: Authenticated Spotipy client
+        playlist_id: Spotify playlist ID
+        verbose: If True, print progress information
+        raise_errors: If True, raise fetch errors instead of printing them
+                      (e.g. when fetching on a worker thread)
+        stopped: Optional event; once set, no further pages are requested
+                 and the iteration ends
+    
+    Yields:
+        dict: Track detail dictionaries
+    """
+    track_count = 0
     
     if verbose:
         print(f"Fetching tracks from playlist {playlist_id}...")
     
-    while True:
-        try:
-            # Fetch tracks with pagination
-            results = sp.playlist_tracks(playlist_id, limit=limit, offset=offset)
-            
+    try:
+        # Pages arrive in order; remaining pages are fetched concurrently
+        for results in iter_track_pages(sp, playlist_id, stopped=stopped):
             if not results or 'items' not in results:
                 break
             
@@ -128,25 +241,44 @@ def fetch_playlist_tracks(sp, playlist_id: str, verbose: bool = False) -> List[D
             for item in items:
                 track_details = extract_track_details(item)
                 if track_details:  # Skip deleted tracks
-                    tracks.append(track_details)
+                    track_count += 1
+                    yield track_details
             
             if verbose:
-                print(f"  Fetched {len(tracks)} tracks so far...")
+                print(f"  Fetched {track_count} tracks so far...")
             
             # Check if there are more tracks
-            if results.get('next'):
-                offset += limit
-            else:
+            if not results.get('next'):
                 break
-                
-        except Exception as e:
-            print(f"Error fetching tracks: {e}")
-            break
+            
+    except Exception as e:
+        if raise_errors:
+            raise
+        print(f"Error fetching tracks: {e}")
     
     if verbose:
-        print(f"Total tracks fetched: {len(tracks)}")
+        print(f"Total tracks fetched: {track_count}")
+
+
+def fetch_playlist_tracks(sp, playlist_id: str, verbose: bool = False,
+                          raise_errors: bool = False,
+                          stopped: Optional[threading.Event] = None) -> List[Dict]:
+    """
+    Fetch all tracks from a playlist, handling pagination.
     
-    return tracks
+    Args:
+        sp: Authenticated Spotipy client
+        playlist_id: Spotify playlist ID
+        verbose: If True, print progress information
+        raise_errors: If True, raise fetch errors instead of printing them
+                      and returning the tracks fetched so far
+        stopped: Optional event; once set, no further pages are requested
+                 and the tracks fetched so far are returned
+    
+    Returns:
+        list: List of track detail dictionaries
+    """
+    return list(iter_playlist_tracks(sp, playlist_id, verbose, raise_errors, stopped))
 
 
 def get_user_playlists(sp, limit: int = 50) -> List[Dict]:
@@ -159,6 +291,10 @@ def get_user_playlists(sp, limit: int = 50) -> List[Dict]:
     
     Returns:
         list: List of playlist dictionaries with id, name, etc.
+    
+    Raises:
+        Exception: If the first page can't be fetched (e.g. the token is
+                   invalid); errors on later pages keep the playlists so far
     """
     playlists = []
     offset = 0
@@ -183,6 +319,11 @@ def get_user_playlists(sp, limit: int = 50) -> List[Dict]:
                 break
                 
         except Exception as e:
+            # This is usually the client's first API call, so a failure here
+            # (bad or expired token) must reach the caller, not look like
+            # an empty account
+            if offset == 0:
+                raise
             print(f"Error fetching playlists: {e}")
             break
     
@@ -219,7 +360,8 @@ def fetch_single_playlist(sp, playlist_name: Optional[str] = None,
         if verbose:
             print(f"Fetching playlist by ID: {playlist_id}")
         try:
-            playlist = sp.playlist(playlist_id)
+            # Only the name is needed here; tracks are paged separately
+            playlist = sp.playlist(playlist_id, fields='name')
             playlist_name = playlist.get('name', 'Unknown')
             tracks = fetch_playlist_tracks(sp, playlist_id, verbose)
             
@@ -7,8 +7,56 @@ using keyword and synonym matching.
 
 import re
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Set, Tuple, Optional
+from typing import FrozenSet, Iterable, List, Dict, Set, Tuple, Optional
+
+try:
+    import orjson  # Optional: faster JSON parsing/serialization
+except ImportError:
+    orjson = None
+
+# Number of playlist files read concurrently
+MAX_LOAD_WORKERS = 8
+
+# Score multiplier for a keyword match in each track field
+DEFAULT_LOCATION_MULTIPLIERS = {'name': 3, 'artist': 2, 'album': 1}
+
+
+def load_tracks_from_json_file(json_file: Path) -> List[Dict]:
+    """
+    Load the tracks from a single playlist JSON file.
+    
+    Adds a 'playlist' field to each track indicating which playlist it came from.
+    Malformed or unreadable files yield an empty list.
+    
+    Args:
+        json_file: Path to a JSON playlist file
+    
+    Returns:
+        List of track dictionaries with 'name', 'artist', 'album', 'release_year', 'playlist'
+    """
+    tracks: List[Dict] = []
+    
+    try:
+        # Extract playlist name from filename
+        playlist_name = json_file.stem
+        
+        data = json_file.read_bytes()
+        playlist_tracks = orjson.loads(data) if orjson else json.loads(data)
+        if isinstance(playlist_tracks, list):
+            # Add playlist name to each track (freshly parsed, safe to modify)
+            for track in playlist_tracks:
+                track['playlist'] = playlist_name
+                tracks.append(track)
+    except json.JSONDecodeError:
+        # Skip malformed JSON files
+        pass
+    except Exception:
+        # Skip files with other errors
+        pass
+    
+    return tracks
 
 
 def load_tracks_from_json_files(data_dir: str) -> List[Dict]:
@@ -16,6 +64,7 @@ def load_tracks_from_json_files(data_dir: str) -> List[Dict]:
     Load all tracks from JSON files in the data directory.
     
     Adds a 'playlist' field to each track indicating which playlist it came from.
+    Files are read concurrently; tracks keep the order of the file listing.
     
     Args:
         data_dir: Directory containing JSON playlist files
@@ -23,7 +72,7 @@ def load_tracks_from_json_files(data_dir: str) -> List[Dict]:
     Returns:
         List of track dictionaries with 'name', 'artist', 'album', 'release_year', 'playlist'
     """
-    tracks = []
+    tracks: List[Dict] = []
     data_path = Path(data_dir)
     
     if not data_path.exists():
@@ -31,30 +80,15 @@ def load_tracks_from_json_files(data_dir: str) -> List[Dict]:
     
     json_files = list(data_path.glob('*.json'))
     
-    for json_file in json_files:
-        try:
-            # Extract playlist name from filename
-            playlist_name = json_file.stem
-            
-            with open(json_file, 'r', encoding='utf-8') as f:
-                playlist_tracks = json.load(f)
-                if isinstance(playlist_tracks, list):
-                    # Add playlist name to each track
-                    for track in playlist_tracks:
-                        track_copy = track.copy()
-                        track_copy['playlist'] = playlist_name
-                        tracks.append(track_copy)
-        except json.JSONDecodeError:
-            # Skip malformed JSON files
-            continue
-        except Exception:
-            # Skip files with other errors
-            continue
+    # Overlap file reads across a small thread pool
+    with ThreadPoolExecutor(max_workers=MAX_LOAD_WORKERS) as executor:
+        for playlist_tracks in executor.map(load_tracks_from_json_file, json_files):
+            tracks.extend(playlist_tracks)
     
     return tracks
 
 
-def expand_keywords_with_synonyms(keywords: List[str], synonyms: Dict[str, List[str]]) -> Set[str]:
+def expand_keywords_with_synonyms(keywords: List[str], synonyms: Dict[str, List[str]]) -> FrozenSet[str]:
     """
     Expand a list of keywords with their synonyms.
     
@@ -63,9 +97,9 @@ def expand_keywords_with_synonyms(keywords: List[str], synonyms: Dict[str, List[
         synonyms: Dictionary mapping keywords to lists of synonyms
     
     Returns:
-        Set of all keywords and synonyms (normalized to lowercase)
+        Frozen set of all keywords and synonyms (normalized to lowercase)
     """
-    expanded = set()
+    expanded: Set[str] = set()
     
     for keyword in keywords:
         keyword_lower = keyword.lower()
@@ -76,16 +110,71 @@ def expand_keywords_with_synonyms(keywords: List[str], synonyms: Dict[str, List[
             for synonym in synonyms[keyword_lower]:
                 expanded.add(synonym.lower())
     
-    return expanded
+    return frozenset(expanded)
+
+
+def compile_word_pattern(keyword: str) -> re.Pattern:
+    """
+    Compile a pattern matching a keyword as a full word (word boundaries).
+    
+    Args:
+        keyword: Keyword to match (lowercase)
+    
+    Returns:
+        Compiled regex pattern, to be searched in lowercased text
+    """
+    return re.compile(r'\b' + re.escape(keyword) + r'\b')
+
+
+def compile_keyword_patterns(keywords: Iterable[str]) -> Dict[str, re.Pattern]:
+    """
+    Compile the full-word pattern for every keyword once.
+    
+    Pass the result to score_track/find_matches_in_text so patterns are not
+    rebuilt for every track field.
+    
+    Args:
+        keywords: Keywords (lowercase)
+    
+    Returns:
+        Dictionary mapping each keyword to its compiled pattern
+    """
+    return {keyword: compile_word_pattern(keyword) for keyword in keywords}
 
 
-def find_matches_in_text(text: str, keywords: Set[str]) -> List[Tuple[str, bool]]:
+def compile_any_keyword_pattern(keywords: Iterable[str]) -> re.Pattern:
+    """
+    Compile a single alternation matching any of the keywords as a substring.
+    
+    One search with this pattern tells whether a text contains any keyword
+    at all, in a single pass instead of one scan per keyword. It only
+    answers "any match?": overlapping keywords (e.g. 'key' inside 'keys')
+    are still classified one by one.
+    
+    Args:
+        keywords: Keywords (lowercase)
+    
+    Returns:
+        Compiled regex pattern, to be searched in lowercased text
+    """
+    # Longest first so the alternation prefers the most specific keyword
+    ordered = sorted(keywords, key=lambda k: (-len(k), k))
+    return re.compile('|'.join(re.escape(keyword) for keyword in ordered))
+
+
+def find_matches_in_text(text: str, keywords: Iterable[str],
+                         patterns: Optional[Dict[str, re.Pattern]] = None,
+                         any_pattern: Optional[re.Pattern] = None) -> List[Tuple[str, bool]]:
     """
     Find all keyword matches in a text string.
     
     Args:
         text: Text to search in
-        keywords: Set of keywords to search for (lowercase)
+        keywords: Keywords to search for (lowercase), matches are reported in this order
+        patterns: Optional precompiled full-word patterns from
+                  compile_keyword_patterns (compiled on demand if omitted)
+        any_pattern: Optional pattern from compile_any_keyword_pattern, used to
+                     skip texts that contain none of the keywords in one pass
     
     Returns:
         List of tuples: (matched_keyword, is_full_word_match)
@@ -94,30 +183,42 @@ def find_matches_in_text(text: str, keywords: Set[str]) -> List[Tuple[str, bool]
         return []
     
     text_lower = text.lower()
-    matches = []
+    
+    if any_pattern is not None and not any_pattern.search(text_lower):
+        return []
+    matches: List[Tuple[str, bool]] = []
     
     for keyword in keywords:
+        # A full word match is also a substring match, so keywords that
+        # don't occur in the text never reach the regex engine
+        if keyword not in text_lower:
+            continue
+        
         # Check for full word match (word boundary)
-        word_boundary_pattern = r'\b' + re.escape(keyword) + r'\b'
-        if re.search(word_boundary_pattern, text_lower, re.IGNORECASE):
+        pattern = patterns[keyword] if patterns else compile_word_pattern(keyword)
+        if pattern.search(text_lower):
             matches.append((keyword, True))
-        # Check for substring match
-        elif keyword in text_lower:
+        # Otherwise it's a substring match
+        else:
             matches.append((keyword, False))
     
     return matches
 
 
-def score_track(track: Dict, keywords: Set[str], 
-                location_multipliers: Dict[str, int] = None) -> Tuple[int, Dict]:
+def score_track(track: Dict, keywords: Iterable[str], 
+                location_multipliers: Optional[Dict[str, int]] = None,
+                patterns: Optional[Dict[str, re.Pattern]] = None,
+                any_pattern: Optional[re.Pattern] = None) -> Tuple[int, Dict]:
     """
     Score a track based on keyword matches.
     
     Args:
         track: Track dictionary with 'name', 'artist', 'album' fields
-        keywords: Set of keywords to match (lowercase)
+        keywords: Keywords to match (lowercase)
         location_multipliers: Dictionary mapping field names to multipliers
                              (default: name=3, artist=2, album=1)
+        patterns: Optional precompiled full-word patterns from compile_keyword_patterns
+        any_pattern: Optional any-keyword pattern from compile_any_keyword_pattern
     
     Returns:
         Tuple of (total_score, match_details_dict)
@@ -127,12 +228,12 @@ def score_track(track: Dict, keywords: Set[str],
         - 'full_word_matches': Set of keywords that matched as full words
     """
     if location_multipliers is None:
-        location_multipliers = {'name': 3, 'artist': 2, 'album': 1}
+        location_multipliers = DEFAULT_LOCATION_MULTIPLIERS
     
     total_score = 0
-    matched_keywords = set()
-    location_matches = {'name': [], 'artist': [], 'album': []}
-    full_word_matches = set()
+    matched_keywords: Set[str] = set()
+    location_matches: Dict[str, List[str]] = {'name': [], 'artist': [], 'album': []}
+    full_word_matches: Set[str] = set()
     
     # Search in each field
     for field_name, multiplier in location_multipliers.items():
@@ -140,11 +241,14 @@ def score_track(track: Dict, keywords: Set[str],
         if not field_value:
             continue
         
-        matches = find_matches_in_text(str(field_value), keywords)
+        matches = find_matches_in_text(str(field_value), keywords, patterns, any_pattern)
+        if not matches:
+            continue
         
+        field_matches = location_matches[field_name]
         for keyword, is_full_word in matches:
             matched_keywords.add(keyword)
-            location_matches[field_name].append(keyword)
+            field_matches.append(keyword)
             
             if is_full_word:
                 full_word_matches.add(keyword)
@@ -152,7 +256,7 @@ def score_track(track: Dict, keywords: Set[str],
                 total_score += 2 * multiplier
             else:
                 # Substring match: +1 point
-                total_score += 1 * multiplier
+                total_score += multiplier
     
     match_details = {
         'matches': sorted(matched_keywords),
@@ -164,15 +268,15 @@ def score_track(track: Dict, keywords: Set[str],
     return total_score, match_details
 
 
-def find_matching_tracks(tracks: List[Dict], keywords: Set[str],
-                         synonyms: Dict[str, List[str]] = None,
+def find_matching_tracks(tracks: List[Dict], keywords: Iterable[str],
+                         synonyms: Optional[Dict[str, List[str]]] = None,
                          min_score: int = 0) -> List[Tuple[Dict, Dict]]:
     """
     Find all tracks that match the given keywords.
     
     Args:
         tracks: List of track dictionaries
-        keywords: Set of base keywords to search for
+        keywords: Base keywords to search for (any iterable, e.g. a set or frozenset)
         synonyms: Optional dictionary mapping keywords to synonyms
         min_score: Minimum score threshold (default: 0, returns all matches)
     
@@ -184,12 +288,31 @@ def find_matching_tracks(tracks: List[Dict], keywords: Set[str],
     if synonyms:
         expanded_keywords = expand_keywords_with_synonyms(list(keywords), synonyms)
     else:
-        expanded_keywords = {k.lower() for k in keywords}
+        expanded_keywords = frozenset(k.lower() for k in keywords)
+    
+    # Fix the keyword order once for the whole search (longest, most specific
+    # first) so every track is scanned the same way, and compile the
+    # full-word and any-keyword patterns once
+    search_keywords = tuple(sorted(expanded_keywords, key=lambda k: (-len(k), k)))
+    patterns = compile_keyword_patterns(search_keywords)
+    any_pattern = compile_any_keyword_pattern(search_keywords)
+    
+    # The fields score_track searches; joined with a separator no keyword contains
+    fields = tuple(DEFAULT_LOCATION_MULTIPLIERS)
     
-    matching_tracks = []
+    matching_tracks: List[Tuple[Dict, Dict]] = []
     
     for track in tracks:
-        score, match_details = score_track(track, expanded_keywords)
+        # Search all of the track's fields at once, so tracks without any
+        # keyword skip score_track and its per-field work entirely
+        haystack = '\0'.join([str(track.get(field) or '').lower() for field in fields])
+        if any_pattern.search(haystack):
+            score, match_details = score_track(track, search_keywords, patterns=patterns,
+                                               any_pattern=any_pattern)
+        else:
+            # Same result score_track gives a track with no matches
+            score = 0
+            match_details = {'matches': [], 'locations': {}, 'full_word_matches': [], 'score': 0}
         
         if score >= min_score:
             matching_tracks.append((track, match_details))